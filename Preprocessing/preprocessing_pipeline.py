@@ -15,11 +15,17 @@ import pandas as pd
 import numpy as np
 import joblib
 import json
+import copy
 import yaml
+import hashlib
+import heapq
 import logging
+from collections import deque
 from pathlib import Path
 from typing import Dict, List, Tuple, Union, Optional
 from datetime import datetime
+from functools import partial, lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 # Core preprocessing
 from sklearn.pipeline import Pipeline
@@ -29,18 +35,69 @@ from sklearn.preprocessing import (
     OneHotEncoder, LabelEncoder, PowerTransformer
 )
 from sklearn.impute import SimpleImputer
-from sklearn.decomposition import PCA
+from sklearn.decomposition import PCA, IncrementalPCA, TruncatedSVD
 from sklearn.manifold import TSNE
 from sklearn.model_selection import train_test_split
+from sklearn.utils import gen_batches
 
 # Statistical analysis
 from scipy import stats
+from scipy import sparse
 from scipy.stats import skew
 
+# Optional: fast non-cryptographic hashing for cache keys
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Optional: JIT compilation of numeric kernels
+try:
+    import numba
+    from numba import njit, prange
+except ImportError:
+    numba = None
+    njit = None
+    prange = range
+
+# Optional: RAPIDS GPU backend for numerical preprocessing
+try:
+    import cupy as cp
+    import cuml.preprocessing as cuml_preprocessing
+except ImportError:
+    cp = None
+    cuml_preprocessing = None
+
+# Optional: Intel oneDAL-accelerated PCA (scikit-learn-intelex)
+try:
+    from sklearnex.decomposition import PCA as IntelPCA
+except ImportError:
+    IntelPCA = None
+
+# Optional: Arrow Feather output for saved datasets
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# Optional: LZ4 compression for saved pipeline pickles
+try:
+    import lz4
+except ImportError:
+    lz4 = None
+
+# Optional: libyaml-backed YAML loader/dumper when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 # Data validation
 import warnings
 warnings.filterwarnings('ignore')
 
+# Copy-on-write: frames share data until modified (the default from pandas 3)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -48,6 +105,345 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Arrays below this size are hashed from their raw bytes; larger ones use xxhash
+_SMALL_ARRAY_BYTES = 1 << 20
+
+# Compression for saved pipeline pickles (only with fast LZ4); raw .npy arrays stay
+# uncompressed so they can be memory-mapped
+_PICKLE_COMPRESSION = ('lz4', 3) if lz4 is not None else 0
+
+# Version of the cached step and result formats; bump whenever a cached step's
+# implementation or return value changes so stale cache entries are not reused
+_CACHE_VERSION = 3
+
+# Leading components probed with randomized SVD for an explained-variance PCA target
+_PCA_PROBE_COMPONENTS = 64
+
+# Most recent per-batch transform() log entries kept per pipeline
+_LOG_MAX_ENTRIES = 1024
+
+
+def _fingerprint(data: Union[np.ndarray, pd.DataFrame]) -> Tuple:
+    """Compute a cheap content fingerprint of an array or dataframe for cache keys."""
+    if isinstance(data, pd.DataFrame):
+        return (list(map(str, data.columns)),
+                _fingerprint(pd.util.hash_pandas_object(data, index=True).to_numpy()))
+    elif sparse.issparse(data):
+        data = data.tocsr()
+        return (data.shape, _fingerprint(data.data), _fingerprint(data.indices), _fingerprint(data.indptr))
+    
+    X = np.ascontiguousarray(data)
+    if X.nbytes <= _SMALL_ARRAY_BYTES:
+        digest = hashlib.sha1(X.tobytes()).hexdigest()
+    elif xxhash is not None:
+        digest = xxhash.xxh3_64(X).hexdigest()
+    else:
+        digest = joblib.hash(X)
+    
+    return (X.shape, X.dtype.str, digest)
+
+
+def _dataset_fingerprint(df: pd.DataFrame, config: Dict) -> str:
+    """Fingerprint a dataframe together with the configuration used to process it."""
+    digest = hashlib.sha256(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    digest.update(json.dumps([_CACHE_VERSION, list(map(str, df.columns)), config],
+                             sort_keys=True, default=str).encode())
+    return digest.hexdigest()[:16]
+
+
+def _gpu_available() -> bool:
+    """Check whether the cuML backend can be used on this machine."""
+    if cp is None or cuml_preprocessing is None:
+        return False
+    try:
+        return cp.cuda.runtime.getDeviceCount() > 0
+    except Exception:
+        return False
+
+
+def _column_skew_kernel(X: np.ndarray) -> np.ndarray:
+    """Biased sample skewness of each column, fusing mean and central moments in one pass."""
+    n_rows, n_cols = X.shape
+    out = np.empty(n_cols)
+    for j in prange(n_cols):
+        mean = 0.0
+        m2 = 0.0
+        m3 = 0.0
+        for i in range(n_rows):
+            n = i + 1.0
+            delta = X[i, j] - mean
+            delta_n = delta / n
+            term = delta * delta_n * i
+            mean += delta_n
+            m3 += term * delta_n * (n - 2.0) - 3.0 * delta_n * m2
+            m2 += term
+        out[j] = np.sqrt(n_rows) * m3 / m2 ** 1.5 if m2 > 0.0 else 0.0
+    return out
+
+
+_column_skew_jit = (
+    njit(parallel=True, fastmath=True, nogil=True, cache=True)(_column_skew_kernel) if njit is not None else None
+)
+
+
+def _column_skew(X: np.ndarray) -> np.ndarray:
+    """Compute column-wise skewness, using the numba kernel when available."""
+    if _column_skew_jit is not None:
+        return _column_skew_jit(np.asarray(X, dtype=np.float64))
+    return skew(X, axis=0)
+
+
+def _one_hot_kernel(codes: np.ndarray, offsets: np.ndarray, out: np.ndarray) -> None:
+    """Scatter per-column category codes into a zeroed one-hot buffer; negative codes stay all-zero."""
+    n_rows, n_cols = codes.shape
+    for i in prange(n_rows):
+        for j in range(n_cols):
+            code = codes[i, j]
+            if code >= 0:
+                out[i, offsets[j] + code] = 1.0
+
+
+_one_hot_kernel_jit = (
+    njit(parallel=True, nogil=True, cache=True)(_one_hot_kernel) if njit is not None else None
+)
+
+
+@lru_cache(maxsize=None)
+def _warm_up_kernels() -> None:
+    """Compile the numba kernels once per process for the array layouts the pipeline uses."""
+    if njit is None:
+        return
+    
+    for order in ('C', 'F'):
+        _column_skew_jit(np.ones((3, 2), dtype=np.float64, order=order))
+        _one_hot_kernel_jit(np.zeros((2, 2), dtype=np.int32), np.zeros(2, dtype=np.int64),
+                            np.zeros((2, 2), dtype=np.float32, order=order))
+
+
+@lru_cache(maxsize=None)
+def _kernels_threadsafe() -> bool:
+    """
+    Whether the numba kernels may run from several Python threads at once.
+    
+    Only the TBB and OpenMP threading layers support concurrent parallel regions;
+    the workqueue fallback aborts the process on concurrent access.
+    """
+    if njit is None:
+        return True
+    
+    _warm_up_kernels()  # The threading layer is only chosen once a parallel kernel has run
+    try:
+        return numba.threading_layer() in ('tbb', 'omp')
+    except ValueError:
+        return False
+
+
+def _one_hot_scatter(codes: np.ndarray, offsets: np.ndarray, out: np.ndarray) -> None:
+    """Scatter category codes into a zeroed one-hot buffer, using the numba kernel when available."""
+    if _one_hot_kernel_jit is not None:
+        _one_hot_kernel_jit(codes, offsets, out)
+        return
+    
+    # Single vectorised fancy-index write over all known (row, column) codes
+    rows, features = np.nonzero(codes >= 0)
+    out[rows, offsets[features] + codes[rows, features]] = 1
+
+
+def _sorted_categorical(column: pd.Series) -> pd.Series:
+    """Factorize a column into a categorical whose categories are its sorted observed values."""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        column = column.cat.remove_unused_categories()
+    else:
+        column = column.astype('category')
+    categories = column.cat.categories
+    if categories.is_monotonic_increasing:
+        return column
+    return column.cat.reorder_categories(categories.sort_values())
+
+
+def _one_hot_codes(encoder: OneHotEncoder, df: pd.DataFrame) -> Optional[Tuple[np.ndarray, np.ndarray, int]]:
+    """
+    Map categorical columns to output-relative codes of a fitted one-hot encoder.
+    
+    Returns the code matrix, the output offset of each column and the total
+    output width, or None if the encoder's categories cannot be coded by pandas.
+    """
+    n_features = len(encoder.categories_)
+    drop_idx = encoder.drop_idx_ if encoder.drop_idx_ is not None else [None] * n_features
+    codes = np.empty((len(df), n_features), dtype=np.int32)
+    offsets = np.empty(n_features, dtype=np.int64)
+    
+    n_outputs = 0
+    for j, (feature, categories) in enumerate(zip(encoder.feature_names_in_, encoder.categories_)):
+        if pd.isna(categories).any():
+            return None
+        
+        # Unknown categories get code -1 and are encoded as all zeros
+        column_codes = pd.Categorical(df[feature], categories=categories).codes.astype(np.int32)
+        if drop_idx[j] is not None:
+            column_codes = np.where(column_codes == drop_idx[j], -1,
+                                    column_codes - (column_codes > drop_idx[j]))
+        
+        codes[:, j] = column_codes
+        offsets[j] = n_outputs
+        n_outputs += len(categories) - (drop_idx[j] is not None)
+    
+    return codes, offsets, n_outputs
+
+
+def _one_hot_encode(encoder: OneHotEncoder, df: pd.DataFrame,
+                    out: Optional[np.ndarray] = None) -> Union[np.ndarray, sparse.spmatrix]:
+    """
+    Transform with a fitted one-hot encoder, using the numba kernel for dense output.
+    
+    Args:
+        encoder: Fitted one-hot encoder
+        df: Categorical features to encode
+        out: Optional preallocated array to write dense output into
+    """
+    coded = None if encoder.sparse_output else _one_hot_codes(encoder, df)
+    
+    if coded is None:
+        X_encoded = encoder.transform(df)
+        if out is None:
+            return X_encoded
+        out[...] = X_encoded
+        return out
+    
+    codes, offsets, n_outputs = coded
+    if out is None:
+        out = np.zeros((len(df), n_outputs), dtype=encoder.dtype)
+    else:
+        out[...] = 0
+    _one_hot_scatter(codes, offsets, out)
+    return out
+
+
+def _fit_yeo_johnson_column(x: np.ndarray) -> Tuple[float, np.ndarray]:
+    """Fit the Yeo-Johnson lambda of one column, returning it with the transformed column."""
+    transformer = PowerTransformer(method='yeo-johnson', standardize=False)
+    x_transformed = transformer.fit_transform(x.reshape(-1, 1))
+    return transformer.lambdas_[0], x_transformed[:, 0]
+
+
+def _column_statistics(df: pd.DataFrame, strategy: str) -> pd.DataFrame:
+    """Reduce every column to its imputation statistic in one vectorized call, as a one-row frame."""
+    if strategy == 'mean':
+        return df.mean().to_frame().T
+    if strategy == 'median':
+        return df.median().to_frame().T
+    if strategy == 'most_frequent':
+        # mode() sorts its values, so ties resolve to the smallest like SimpleImputer
+        return df.mode().reindex(index=[0])
+    return df.head(1)
+
+
+def _truncate_pca(pca: Union[PCA, TruncatedSVD], n_components: int) -> None:
+    """Keep only the leading components of a fitted PCA/TruncatedSVD in place."""
+    if isinstance(pca, (PCA, IncrementalPCA)):
+        # Residual variance per discarded dimension, also valid when only a
+        # leading subset of components was fitted
+        n_samples = pca.n_samples_ if isinstance(pca, PCA) else pca.n_samples_seen_
+        n_max = min(n_samples, pca.n_features_in_)
+        if n_components < n_max:
+            total_var = np.sum(pca.explained_variance_) / np.sum(pca.explained_variance_ratio_)
+            pca.noise_variance_ = ((total_var - np.sum(pca.explained_variance_[:n_components]))
+                                   / (n_max - n_components))
+        pca.n_components_ = n_components
+    
+    pca.components_ = pca.components_[:n_components]
+    pca.explained_variance_ = pca.explained_variance_[:n_components]
+    pca.explained_variance_ratio_ = pca.explained_variance_ratio_[:n_components]
+    pca.singular_values_ = pca.singular_values_[:n_components]
+    pca.n_components = n_components
+
+
+def _yeo_johnson_inplace(X: np.ndarray, lambdas: np.ndarray, columns: np.ndarray) -> np.ndarray:
+    """Apply fitted Yeo-Johnson lambdas to the given columns, overwriting X."""
+    for j, lmbda in zip(columns, lambdas):
+        X[:, j] = stats.yeojohnson(X[:, j], lmbda)
+    return X
+
+
+def _project(X: Union[np.ndarray, sparse.spmatrix], components_t: np.ndarray,
+             offset: Optional[np.ndarray]) -> np.ndarray:
+    """Project onto fitted components and subtract the projected mean, as PCA.transform does."""
+    X_projected = X @ components_t
+    if offset is not None:
+        X_projected -= offset
+    return X_projected
+
+
+def _count_missing(dataset: pd.DataFrame) -> int:
+    """Count missing values, scanning all-float frames as one array in a single reduction."""
+    if all(isinstance(dtype, np.dtype) and dtype.kind == 'f' for dtype in dataset.dtypes):
+        return int(np.count_nonzero(np.isnan(dataset.to_numpy())))
+    return int(dataset.isna().to_numpy().sum())
+
+
+def _to_frame(X: Union[np.ndarray, sparse.spmatrix], columns: List[str],
+              index: pd.Index) -> pd.DataFrame:
+    """Wrap a dense or sparse matrix in a dataframe."""
+    if sparse.issparse(X):
+        return pd.DataFrame.sparse.from_spmatrix(X, index=index, columns=columns)
+    return pd.DataFrame(X, columns=columns, index=index, copy=False)
+
+
+def _run_cached_step(step: str, key: str, compute):
+    """Run a preprocessing step; memoised by joblib.Memory on (step, key) only."""
+    return compute()
+
+
+def _save_component(component: object, prefix: str) -> None:
+    """
+    Save a fitted component, storing its numeric array attributes as raw .npy files.
+    
+    The remaining estimator state is pickled compressed and a JSON stub records
+    the class name and the shape/dtype of each array written alongside it.
+    """
+    arrays = {}
+    if hasattr(component, '__dict__') and not isinstance(component, np.ndarray):
+        arrays = {attr: value for attr, value in vars(component).items()
+                  if type(value) is np.ndarray and value.dtype.kind in 'biufc'}
+    
+    skeleton = component
+    if arrays:
+        skeleton = copy.copy(component)
+        for attr, value in arrays.items():
+            delattr(skeleton, attr)
+            np.save(f"{prefix}_{attr}.npy", value)
+    
+    joblib.dump(skeleton, f"{prefix}.pkl", compress=_PICKLE_COMPRESSION)
+    
+    metadata = {
+        'class': type(component).__name__,
+        'arrays': {attr: {'shape': list(value.shape), 'dtype': value.dtype.str}
+                   for attr, value in arrays.items()}
+    }
+    with open(f"{prefix}.json", 'w') as f:
+        json.dump(metadata, f)
+
+
+def _load_component(prefix: str) -> object:
+    """Load a component saved by _save_component, memory-mapping its arrays."""
+    component = joblib.load(f"{prefix}.pkl")
+    
+    # Components saved as a single pickle have no metadata stub
+    metadata_path = Path(f"{prefix}.json")
+    if not metadata_path.exists():
+        return component
+    
+    with open(metadata_path, 'r') as f:
+        metadata = json.load(f)
+    
+    if metadata['class'] != type(component).__name__:
+        raise ValueError(f"Component at {prefix} is {type(component).__name__}, expected {metadata['class']}")
+    
+    for attr in metadata['arrays']:
+        setattr(component, attr, np.load(f"{prefix}_{attr}.npy", mmap_mode='r'))
+    
+    return component
+
 
 class ESGPreprocessingPipeline:
     """
@@ -80,16 +476,46 @@ class ESGPreprocessingPipeline:
         self.config = self._load_config(config_path)
         self.pipeline_components = {}
         self.feature_names_ = {}
+        self._feature_counts = {}
         self.preprocessing_log = []
         self.fitted = False
         
         # Initialize component storage
+        self.numerical_imputer = None
+        self.categorical_imputer = None
         self.power_transformer = None
+        self._power_cols = None
         self.scaler = None
         self.categorical_encoder = None
         self.pca = None
         self.tsne = None
         
+        # Validation-free array callables for transform(), bound once the pipeline is fitted
+        self._transform_plan = {}
+        
+        # Compile numba kernels up front so fit_transform does not pay for it
+        _warm_up_kernels()
+        
+        # Numerical backend: cuML on GPU when requested and available
+        self.backend = 'sklearn'
+        if self.config['preprocessing'].get('use_gpu', False):
+            if _gpu_available():
+                self.backend = 'cuml'
+            else:
+                logger.warning("GPU backend requested but cuML/CUDA is unavailable. Using scikit-learn.")
+        
+        # oneDAL-accelerated PCA when scikit-learn-intelex is installed; t-SNE stays on
+        # scikit-learn so embeddings do not depend on the installed packages
+        self.use_intelex = self.config['preprocessing'].get('use_intelex', True) and IntelPCA is not None
+        if self.use_intelex:
+            logger.info("oneDAL backend active for PCA")
+        
+        # On-disk cache for intermediate fitting steps (opt-in)
+        self.memory = None
+        if self.config['output'].get('cache_intermediate_steps', False):
+            self.memory = joblib.Memory(location=str(self._cache_dir()), mmap_mode='c', verbose=0)
+            self._cached_step = self.memory.cache(_run_cached_step, ignore=['compute'])
+        
         logger.info("ESG Preprocessing Pipeline initialized")
     
     def _load_config(self, config_path: Optional[str]) -> Dict:
@@ -103,16 +529,23 @@ class ESGPreprocessingPipeline:
                 'power_transform_method': 'yeo-johnson',
                 'skewness_threshold': 1.0,
                 'categorical_encoding': 'onehot',
-                'drop_first_category': True
+                'drop_first_category': True,
+                'use_gpu': False,
+                'use_intelex': True,
+                'sparse_categorical': False,
+                'chunk_size': None
             },
             'dimensionality_reduction': {
                 'apply_pca': True,
                 'pca_n_components': 0.95,  # Explained variance threshold
                 'pca_min_components': 5,
+                'pca_random_state': 42,
+                'pca_variance_probe': False,
                 'apply_tsne': True,
                 'tsne_n_components': 2,
                 'tsne_perplexity': 30,
-                'tsne_random_state': 42
+                'tsne_random_state': 42,
+                'tsne_backend': 'sklearn'
             },
             'feature_categories': {
                 'financial_features': ['Revenue', 'ProfitMargin', 'MarketCap', 'GrowthRate'],
@@ -131,7 +564,11 @@ class ESGPreprocessingPipeline:
                 'save_intermediate_steps': True,
                 'save_path': '../Data/',
                 'save_fitted_pipeline': True,
-                'pipeline_save_path': '../Models/'
+                'pipeline_save_path': '../Models/',
+                'cache_intermediate_steps': False,
+                'cache_max_size_mb': 512,
+                'cache_results': False,
+                'save_format': 'csv'
             }
         }
         
@@ -139,7 +576,7 @@ class ESGPreprocessingPipeline:
             try:
                 with open(config_path, 'r') as f:
                     if config_path.endswith('.yaml') or config_path.endswith('.yml'):
-                        user_config = yaml.safe_load(f)
+                        user_config = yaml.load(f, Loader=_YAML_LOADER)
                     else:
                         user_config = json.load(f)
                 
@@ -162,35 +599,173 @@ class ESGPreprocessingPipeline:
             else:
                 base_dict[key] = value
     
-    def _log_step(self, step: str, details: str) -> None:
-        """Log preprocessing step with timestamp."""
-        log_entry = {
-            'timestamp': datetime.now().isoformat(),
-            'step': step,
-            'details': details
+    def _log_step(self, step: str, details: str, *args, batch: bool = False) -> None:
+        """
+        Log preprocessing step with timestamp.
+        
+        With args, details is a %-style format string that is only formatted
+        when the message is emitted or the log is read. Per-batch transform()
+        steps (batch=True) go to a bounded log so they cannot evict the fit record.
+        """
+        (self._batch_log if batch else self._log).append((datetime.now(), step, details, args))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s: %s", step, details % args if args else details)
+    
+    @property
+    def preprocessing_log(self) -> List[Dict]:
+        """Logged preprocessing steps, formatted on access."""
+        return [
+            {'timestamp': timestamp.isoformat(), 'step': step, 'details': details % args if args else details}
+            for timestamp, step, details, args in heapq.merge(self._log, self._batch_log,
+                                                              key=lambda entry: entry[0])
+        ]
+    
+    @preprocessing_log.setter
+    def preprocessing_log(self, entries: List[Dict]) -> None:
+        self._log = [
+            (datetime.fromisoformat(entry['timestamp']), entry['step'], entry['details'], ())
+            for entry in entries
+        ]
+        self._batch_log = deque(maxlen=_LOG_MAX_ENTRIES)
+    
+    def _cache_dir(self) -> Path:
+        """Directory holding cached preprocessing artifacts."""
+        return Path(self.config['output']['save_path']) / '.cache'
+    
+    def _load_cached_results(self, cache_file: Path) -> Dict[str, pd.DataFrame]:
+        """Load results and fitted components cached by a previous identical fit."""
+        with pd.HDFStore(cache_file, mode='r') as store:
+            result_order = store['result_order'].tolist()
+            results = {name: store[name] for name in result_order}
+        
+        self.load_pipeline(str(cache_file.with_suffix('')))
+        self._log_step("Cache Hit", f"Loaded preprocessed results from {cache_file}")
+        
+        return results
+    
+    def _save_cached_results(self, cache_file: Path, results: Dict[str, pd.DataFrame]) -> None:
+        """Cache results and fitted components so an identical fit can be skipped."""
+        unsupported = (pd.SparseDtype, pd.ArrowDtype, pd.CategoricalDtype, pd.StringDtype)
+        if any(isinstance(dtype, unsupported) for dataset in results.values() for dtype in dataset.dtypes):
+            self._log_step("Result Caching",
+                           "Skipped: sparse/Arrow/categorical/string results are not supported in HDF5")
+            return
+        
+        # Write to a temporary file first so a partial write is never treated as a hit;
+        # the pipeline is only saved once the results were written
+        temp_file = cache_file.with_suffix('.h5.tmp')
+        try:
+            for name, dataset in results.items():
+                dataset.to_hdf(temp_file, key=name, mode='a', complib='blosc:lz4', complevel=3)
+            pd.Series(list(results)).to_hdf(temp_file, key='result_order', mode='a')
+            self.save_pipeline(str(cache_file.with_suffix('')))
+        except Exception as e:
+            temp_file.unlink(missing_ok=True)
+            logger.warning(f"Failed to cache preprocessed results: {e}")
+            return
+        temp_file.replace(cache_file)
+        
+        self._log_step("Result Caching", f"Cached preprocessed results to {cache_file}")
+    
+    def _cached(self, step: str, inputs: Tuple, subconfig, compute):
+        """
+        Run a fitting step through the on-disk cache when caching is enabled.
+        
+        Args:
+            step: Name of the preprocessing step
+            inputs: Arrays/dataframes the step depends on
+            subconfig: Configuration values the step depends on
+            compute: Zero-argument callable performing the step
+        """
+        if self.memory is None:
+            return compute()
+        
+        key = joblib.hash((_CACHE_VERSION, step, [_fingerprint(x) for x in inputs], subconfig))
+        if self._cached_step.check_call_in_cache(step, key, compute):
+            self._log_step("Cache Hit", "Reused cached %s", step)
+        
+        return self._cached_step(step, key, compute)
+    
+    def _reduce_cache(self) -> None:
+        """Evict least recently used cache entries beyond the configured budget."""
+        if self.memory is None:
+            return
+        
+        max_bytes = int(self.config['output'].get('cache_max_size_mb', 512) * 1024 ** 2)
+        self.memory.reduce_size(bytes_limit=max_bytes)
+    
+    def _to_device(self, X: np.ndarray):
+        """Move an array to the GPU when the cuML backend is active."""
+        return cp.asarray(X) if self.backend == 'cuml' else X
+    
+    def _to_host(self, X) -> np.ndarray:
+        """Move an array back to host memory if it lives on the GPU."""
+        return cp.asnumpy(X) if cp is not None and isinstance(X, cp.ndarray) else X
+    
+    def _numerical_matrix(self, df: pd.DataFrame, numerical_features: List[str]) -> np.ndarray:
+        """Extract numerical features column by column into a column-major float32 matrix."""
+        out = np.empty((len(df), len(numerical_features)), dtype=np.float32, order='F')
+        
+        # Copy each column straight into the matrix without an intermediate dataframe
+        for j, feature in enumerate(numerical_features):
+            out[:, j] = df[feature].to_numpy()
+        return out
+    
+    def _scale_into(self, X: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """Apply the fitted scaler, writing the scaled features into out."""
+        if isinstance(self.scaler, StandardScaler):
+            np.subtract(X, self.scaler.mean_, out=out)
+            out /= self.scaler.scale_
+        else:
+            out[...] = self._to_host(self.scaler.transform(self._to_device(X)))
+        return out
+    
+    def _make_power_transformer(self, method: str):
+        """Create a power transformer for the active backend."""
+        if self.backend == 'cuml':
+            return cuml_preprocessing.PowerTransformer(method=method, standardize=False)
+        return PowerTransformer(method=method, standardize=False)
+    
+    def _make_scaler(self):
+        """Create the configured scaler for the active backend."""
+        scaling_method = self.config['preprocessing']['scaling_method']
+        scalers = {
+            'standard': StandardScaler,
+            'robust': RobustScaler,
+            'minmax': MinMaxScaler
         }
-        self.preprocessing_log.append(log_entry)
-        logger.info(f"{step}: {details}")
+        
+        if scaling_method not in scalers:
+            logger.warning(f"Unknown scaling method: {scaling_method}. Using StandardScaler.")
+            scaling_method = 'standard'
+        
+        if self.backend == 'cuml':
+            return getattr(cuml_preprocessing, scalers[scaling_method].__name__)()
+        return scalers[scaling_method]()
     
     def _identify_feature_types(self, df: pd.DataFrame) -> Dict[str, List[str]]:
         """Automatically identify feature types from dataframe."""
         feature_categories = self.config['feature_categories']
         
         # Get available columns
-        available_cols = df.columns.tolist()
+        available_cols = set(df.columns)
         
         # Filter feature categories to only include available columns
         identified_features = {}
         for category, features in feature_categories.items():
             identified_features[category] = [f for f in features if f in available_cols]
         
-        # Identify numerical and categorical features automatically
-        numerical_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-        categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
-        
-        # Remove identifier columns from numerical features
-        numerical_cols = [col for col in numerical_cols 
-                         if col not in identified_features['identifier_features']]
+        # Identify numerical and categorical features in one pass over the schema,
+        # excluding identifier columns from numerical features
+        identifier_cols = set(identified_features['identifier_features'])
+        numerical_cols = []
+        categorical_cols = []
+        for col, dtype in df.dtypes.items():
+            if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+                if col not in identifier_cols:
+                    numerical_cols.append(col)
+            elif pd.api.types.is_string_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+                categorical_cols.append(col)
         
         identified_features['numerical_features'] = numerical_cols
         identified_features['categorical_features_available'] = categorical_cols
@@ -200,117 +775,196 @@ class ESGPreprocessingPipeline:
         
         return identified_features
     
+    def _fit_imputers(self, df: pd.DataFrame, feature_types: Dict[str, List[str]]) -> None:
+        """Fit missing value imputers so new data is filled with training statistics."""
+        numerical_features = feature_types['numerical_features']
+        categorical_features = feature_types['categorical_features_available']
+        
+        self.numerical_imputer = None
+        if numerical_features:
+            strategy = self.config['preprocessing']['missing_strategy_numerical']
+            strategy = 'most_frequent' if strategy == 'mode' else strategy
+            # Fitting on the precomputed statistics row reproduces the full fit
+            self.numerical_imputer = SimpleImputer(
+                strategy=strategy,
+                keep_empty_features=True
+            ).fit(_column_statistics(df[numerical_features], strategy))
+        
+        self.categorical_imputer = None
+        if categorical_features:
+            strategy = self.config['preprocessing']['missing_strategy_categorical']
+            strategy = 'most_frequent' if strategy == 'most_frequent' else 'constant'
+            self.categorical_imputer = SimpleImputer(
+                strategy=strategy,
+                fill_value='Unknown',
+                keep_empty_features=True
+            ).fit(_column_statistics(df[categorical_features], strategy))
+    
     def _handle_missing_values(self, df: pd.DataFrame, 
-                              feature_types: Dict[str, List[str]]) -> pd.DataFrame:
-        """Handle missing values according to configuration."""
-        df_clean = df.copy()
-        missing_info = {}
+                              feature_types: Optional[Dict[str, List[str]]],
+                              fit: bool = True) -> pd.DataFrame:
+        """
+        Handle missing values according to configuration.
+        
+        Args:
+            df: Input dataframe
+            feature_types: Identified feature types (only needed when fitting)
+            fit: Whether to fit the imputers or reuse the fitted ones
+        """
+        if fit:
+            self._fit_imputers(df, feature_types)
         
         # Check for missing values
-        missing_counts = df_clean.isnull().sum()
-        missing_features = missing_counts[missing_counts > 0]
+        has_missing = df.isna().any()
+        missing_features = has_missing.index[has_missing]
         
-        if len(missing_features) > 0:
-            self._log_step("Missing Values Detection", 
-                          f"Found missing values in {len(missing_features)} features")
-            
-            # Handle numerical missing values
-            numerical_missing = [col for col in missing_features.index 
-                               if col in feature_types['numerical_features']]
-            
-            if numerical_missing:
-                strategy = self.config['preprocessing']['missing_strategy_numerical']
-                for col in numerical_missing:
-                    if strategy == 'median':
-                        fill_value = df_clean[col].median()
-                    elif strategy == 'mean':
-                        fill_value = df_clean[col].mean()
-                    else:  # mode
-                        fill_value = df_clean[col].mode().iloc[0] if not df_clean[col].mode().empty else 0
-                    
-                    df_clean[col].fillna(fill_value, inplace=True)
-                    missing_info[col] = {'strategy': strategy, 'fill_value': fill_value}
-            
-            # Handle categorical missing values
-            categorical_missing = [col for col in missing_features.index 
-                                 if col in feature_types['categorical_features_available']]
-            
-            if categorical_missing:
-                strategy = self.config['preprocessing']['missing_strategy_categorical']
-                for col in categorical_missing:
-                    if strategy == 'most_frequent':
-                        fill_value = df_clean[col].mode().iloc[0] if not df_clean[col].mode().empty else 'Unknown'
-                    else:
-                        fill_value = 'Unknown'
-                    
-                    df_clean[col].fillna(fill_value, inplace=True)
-                    missing_info[col] = {'strategy': strategy, 'fill_value': fill_value}
+        if len(missing_features) == 0:
+            self._log_step("Missing Values Check", "No missing values found", batch=not fit)
+            return df
+        
+        self._log_step("Missing Values Detection", 
+                      "Found missing values in %d features", len(missing_features), batch=not fit)
+        
+        # Collect fill values from the fitted imputers and fill all gaps in one call
+        fill_map = {}
+        missing_info = {}
+        
+        for imputer in (self.numerical_imputer, self.categorical_imputer):
+            if imputer is None:
+                continue
             
-            self._log_step("Missing Values Handling", 
-                          f"Imputed {len(missing_info)} features: {list(missing_info.keys())}")
-        else:
-            self._log_step("Missing Values Check", "No missing values found")
+            for feature, fill_value in zip(imputer.feature_names_in_, imputer.statistics_):
+                if feature in missing_features:
+                    fill_map[feature] = fill_value
+                    missing_info[feature] = {'strategy': imputer.strategy, 'fill_value': fill_value}
+        
+        # Shallow copy: only the imputed columns are replaced with new data
+        df_clean = df.copy(deep=False)
+        imputed_features = list(fill_map)
+        df_clean[imputed_features] = df[imputed_features].fillna(fill_map)
+        
+        self._log_step("Missing Values Handling", 
+                      "Imputed %d features: %s", len(missing_info), list(missing_info.keys()),
+                      batch=not fit)
         
         return df_clean
     
     def _apply_power_transformation(self, X: np.ndarray, 
-                                   feature_names: List[str]) -> Tuple[np.ndarray, PowerTransformer]:
-        """Apply power transformation to reduce skewness."""
+                                   feature_names: List[str]) -> Tuple[np.ndarray, PowerTransformer, np.ndarray]:
+        """
+        Apply power transformation to reduce skewness.
+        
+        Only the highly skewed columns are fitted and transformed; the others pass
+        through unchanged. Returns the transformed matrix, the transformer and the
+        indices of the columns it applies to.
+        """
         if not self.config['preprocessing']['apply_power_transform']:
-            return X, None
+            return X, None, None
         
-        # Check skewness
+        # Check skewness of all columns in one fused pass
         skewness_threshold = self.config['preprocessing']['skewness_threshold']
-        original_skew = {}
-        high_skew_features = []
-        
-        for i, feature in enumerate(feature_names):
-            skew_value = skew(X[:, i])
-            original_skew[feature] = skew_value
-            if abs(skew_value) >= skewness_threshold:
-                high_skew_features.append(feature)
+        original_skew = _column_skew(X)
+        high_skew_mask = np.abs(original_skew) >= skewness_threshold
+        high_skew_features = np.asarray(feature_names)[high_skew_mask].tolist()
         
         if not high_skew_features:
             self._log_step("Skewness Analysis", "No highly skewed features found")
-            return X, None
+            return X, None, None
         
-        # Apply power transformation
+        # Apply power transformation to the skewed block only
+        power_columns = np.flatnonzero(high_skew_mask)
+        X_skewed = X[:, power_columns]
         method = self.config['preprocessing']['power_transform_method']
-        power_transformer = PowerTransformer(method=method, standardize=False)
-        X_transformed = power_transformer.fit_transform(X)
+        if method == 'yeo-johnson' and self.backend == 'sklearn':
+            right_skewed = original_skew[high_skew_mask] > 0
+            X_skewed_transformed, power_transformer = self._fit_yeo_johnson(X_skewed, right_skewed)
+        else:
+            power_transformer = self._make_power_transformer(method)
+            X_skewed_transformed = self._to_host(power_transformer.fit_transform(self._to_device(X_skewed)))
+        
+        X_transformed = np.array(X, order='F')
+        X_transformed[:, power_columns] = X_skewed_transformed  # Assignment guards against upcasting
         
         # Log improvements
+        new_skew = _column_skew(X_transformed[:, power_columns])
         improvements = {}
-        for i, feature in enumerate(feature_names):
-            if feature in high_skew_features:
-                new_skew = skew(X_transformed[:, i])
-                improvement = abs(original_skew[feature]) - abs(new_skew)
-                improvements[feature] = {
-                    'original_skew': original_skew[feature],
-                    'new_skew': new_skew,
-                    'improvement': improvement
-                }
+        for feature, old_value, new_value in zip(high_skew_features,
+                                                 original_skew[high_skew_mask],
+                                                 new_skew):
+            improvements[feature] = {
+                'original_skew': old_value,
+                'new_skew': new_value,
+                'improvement': abs(old_value) - abs(new_value)
+            }
         
         self._log_step("Power Transformation", 
                       f"Applied {method} to {len(high_skew_features)} features")
         
+        return X_transformed, power_transformer, power_columns
+    
+    def _fit_yeo_johnson(self, X: np.ndarray,
+                         right_skewed: np.ndarray) -> Tuple[np.ndarray, PowerTransformer]:
+        """
+        Fit Yeo-Johnson on highly skewed columns, using log1p for non-negative right-skewed ones.
+        
+        Yeo-Johnson with lambda=0 is exactly log1p on non-negative data, so those
+        columns skip the lambda search; log1p would worsen left skew, so left-skewed
+        columns are fitted along with the rest, in parallel. The lambdas are set on a
+        PowerTransformer so transform() replays them.
+        """
+        log_mask = right_skewed & (X.min(axis=0) >= 0)
+        fit_columns = np.flatnonzero(~log_mask)
+        
+        lambdas = np.zeros(X.shape[1])
+        X_transformed = np.empty_like(X, order='F')
+        X_transformed[:, log_mask] = np.log1p(X[:, log_mask])
+        
+        fitted = joblib.Parallel(n_jobs=-1, prefer='threads')(
+            joblib.delayed(_fit_yeo_johnson_column)(X[:, j]) for j in fit_columns
+        )
+        for j, (lmbda, column) in zip(fit_columns, fitted):
+            lambdas[j] = lmbda
+            X_transformed[:, j] = column
+        
+        power_transformer = PowerTransformer(method='yeo-johnson', standardize=False)
+        power_transformer.lambdas_ = lambdas
+        power_transformer.n_features_in_ = X.shape[1]
+        
+        self._log_step("Yeo-Johnson Fitting", 
+                      f"log1p for {int(log_mask.sum())} features, fitted lambdas for {len(fit_columns)} features")
+        
         return X_transformed, power_transformer
     
-    def _apply_scaling(self, X: np.ndarray) -> Tuple[np.ndarray, object]:
-        """Apply scaling to numerical features."""
-        scaling_method = self.config['preprocessing']['scaling_method']
+    def _apply_scaling(self, X: np.ndarray,
+                       out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, object]:
+        """
+        Apply scaling to numerical features.
         
-        if scaling_method == 'standard':
-            scaler = StandardScaler()
-        elif scaling_method == 'robust':
-            scaler = RobustScaler()
-        elif scaling_method == 'minmax':
-            scaler = MinMaxScaler()
+        Args:
+            X: Numerical feature matrix
+            out: Optional preallocated array to write the scaled features into
+        """
+        scaler = self._make_scaler()
+        chunk_size = self.config['preprocessing'].get('chunk_size')
+        
+        if chunk_size and isinstance(scaler, (StandardScaler, MinMaxScaler)):
+            # Stream the fit and the transform over row batches to bound temporary memory
+            for batch in gen_batches(len(X), chunk_size):
+                scaler.partial_fit(X[batch])
+            X_scaled = out if out is not None else np.empty(X.shape, dtype=np.float32, order='F')
+            for batch in gen_batches(len(X), chunk_size):
+                X_scaled[batch] = scaler.transform(X[batch])
+        elif out is None:
+            X_scaled = self._to_host(scaler.fit_transform(self._to_device(X)))
+        elif isinstance(scaler, StandardScaler):
+            # Standardize straight into the output buffer
+            scaler.fit(X)
+            np.subtract(X, scaler.mean_, out=out)
+            out /= scaler.scale_
+            X_scaled = out
         else:
-            logger.warning(f"Unknown scaling method: {scaling_method}. Using StandardScaler.")
-            scaler = StandardScaler()
-        
-        X_scaled = scaler.fit_transform(X)
+            out[...] = self._to_host(scaler.fit_transform(self._to_device(X)))
+            X_scaled = out
         
         self._log_step("Feature Scaling", f"Applied {scaler.__class__.__name__}")
         
@@ -325,13 +979,29 @@ class ESGPreprocessingPipeline:
         encoding_method = self.config['preprocessing']['categorical_encoding']
         
         if encoding_method == 'onehot':
+            df_categorical = df[categorical_features]
+            categories = 'auto'
+            fit_rows = df_categorical
+            
+            # Factorize each column once: its sorted categories are the encoder vocabulary, so the
+            # encoder skips its own unique scan and the encoding step reuses the codes.
+            # Missing values (code -1) keep the encoder's own discovery, which treats them as a category
+            df_coded = pd.DataFrame({feature: _sorted_categorical(df_categorical[feature])
+                                     for feature in categorical_features})
+            if all(df_coded[feature].cat.codes.min() >= 0 for feature in categorical_features):
+                df_categorical = df_coded
+                categories = [df_coded[feature].cat.categories.to_numpy() for feature in categorical_features]
+                fit_rows = df_coded.iloc[:1]
+            
             encoder = OneHotEncoder(
+                categories=categories,
                 drop='first' if self.config['preprocessing']['drop_first_category'] else None,
-                sparse_output=False,
-                handle_unknown='ignore'
+                sparse_output=self.config['preprocessing'].get('sparse_categorical', False),
+                handle_unknown='ignore',
+                dtype=np.float32
             )
-            
-            X_categorical = encoder.fit_transform(df[categorical_features])
+            encoder.fit(fit_rows)
+            X_categorical = _one_hot_encode(encoder, df_categorical)
             
             # Get feature names
             feature_names = encoder.get_feature_names_out(categorical_features)
@@ -345,6 +1015,43 @@ class ESGPreprocessingPipeline:
             logger.warning(f"Encoding method {encoding_method} not implemented. Skipping categorical encoding.")
             return np.array([]).reshape(len(df), 0), [], None
     
+    def _fit_tsne(self, X: np.ndarray, n_components: int, perplexity: float,
+                  random_state: int) -> Tuple[np.ndarray, object]:
+        """Fit the configured t-SNE backend, falling back to scikit-learn if unavailable."""
+        backend = self.config['dimensionality_reduction'].get('tsne_backend', 'sklearn')
+        
+        if backend == 'openTSNE':
+            try:
+                from openTSNE import TSNE as OpenTSNE
+            except ImportError:
+                logger.warning("openTSNE is not installed. Using scikit-learn t-SNE.")
+            else:
+                embedding = OpenTSNE(
+                    n_components=n_components,
+                    perplexity=perplexity,
+                    initialization='pca',
+                    negative_gradient_method='fft' if n_components <= 2 else 'bh',
+                    n_jobs=-1,
+                    random_state=random_state
+                ).fit(X)
+                return np.asarray(embedding), embedding
+        
+        elif backend == 'umap':
+            try:
+                from umap import UMAP
+            except ImportError:
+                logger.warning("umap-learn is not installed. Using scikit-learn t-SNE.")
+            else:
+                reducer = UMAP(n_components=n_components, n_jobs=-1, random_state=random_state)
+                return reducer.fit_transform(X), reducer
+        
+        tsne = TSNE(
+            n_components=n_components,
+            perplexity=perplexity,
+            random_state=random_state
+        )
+        return tsne.fit_transform(X), tsne
+    
     def _apply_dimensionality_reduction(self, X: np.ndarray, 
                                       feature_names: List[str]) -> Dict[str, Tuple[np.ndarray, object]]:
         """Apply dimensionality reduction techniques."""
@@ -352,30 +1059,70 @@ class ESGPreprocessingPipeline:
         
         # PCA
         if self.config['dimensionality_reduction']['apply_pca']:
+            pca_class = IntelPCA if self.use_intelex else PCA
             n_components = self.config['dimensionality_reduction']['pca_n_components']
             min_components = self.config['dimensionality_reduction']['pca_min_components']
+            random_state = self.config['dimensionality_reduction'].get('pca_random_state', 42)
+            variance_probe = self.config['dimensionality_reduction'].get('pca_variance_probe', False)
+            
+            # Sparse input (sparse one-hot encoding) is reduced with TruncatedSVD
+            is_sparse = sparse.issparse(X)
+            
+            # Dense input is fitted batch by batch with IncrementalPCA when chunking is enabled
+            chunk_size = self.config['preprocessing'].get('chunk_size')
+            streaming = bool(chunk_size) and not is_sparse
             
             # Handle different n_components specifications
             if isinstance(n_components, float) and n_components <= 1.0:
-                # Use explained variance ratio
-                pca = PCA(n_components=None)
-                pca.fit(X)
+                # Use explained variance ratio: when enabled, probe the leading components with
+                # randomized SVD. The probe only pays off for data whose variance is concentrated
+                # in a few components; otherwise it misses the target and the full fit runs anyway.
+                # Tall dense inputs (up to 1000 features) skip the probe, since the full fit
+                # then uses a cheap covariance eigendecomposition
+                pca = None
+                n_probe = min(_PCA_PROBE_COMPONENTS, min(X.shape))
+                covariance_solvable = X.shape[1] <= 1000 and X.shape[0] >= 10 * X.shape[1]
+                if (variance_probe and not streaming and n_probe < min(X.shape)
+                        and (is_sparse or not covariance_solvable)):
+                    pca = (TruncatedSVD(n_components=n_probe, random_state=random_state) if is_sparse
+                           else pca_class(n_components=n_probe, svd_solver='randomized',
+                                          random_state=random_state))
+                    pca.fit(X)
+                    
+                    # The target lies beyond the probed components: fall back to a full fit
+                    if np.sum(pca.explained_variance_ratio_) < n_components:
+                        pca = None
+                
+                if pca is None:
+                    if streaming:
+                        # Batches of at least n_features rows keep the full spectrum
+                        pca = IncrementalPCA(n_components=None, batch_size=max(chunk_size, X.shape[1]))
+                    elif is_sparse:
+                        pca = TruncatedSVD(n_components=min(X.shape))
+                    else:
+                        pca = pca_class(n_components=None)
+                    pca.fit(X)
                 
                 # Find number of components for desired explained variance
                 cumsum_var = np.cumsum(pca.explained_variance_ratio_)
-                n_comp = np.argmax(cumsum_var >= n_components) + 1
-                n_comp = max(n_comp, min_components)  # Ensure minimum components
+                n_comp = int(np.searchsorted(cumsum_var, n_components)) + 1
+                n_comp = min(max(n_comp, min_components), len(cumsum_var))  # Ensure minimum components
                 
-                # Refit with determined number of components
-                pca = PCA(n_components=n_comp)
-                X_pca = pca.fit_transform(X)
+                # Keep the leading components instead of refitting
+                _truncate_pca(pca, n_comp)
+                X_pca = pca.transform(X)
                 
                 explained_var = np.sum(pca.explained_variance_ratio_)
                 
             else:
                 # Use explicit number of components
                 n_comp = int(n_components) if isinstance(n_components, float) else n_components
-                pca = PCA(n_components=n_comp)
+                if streaming:
+                    pca = IncrementalPCA(n_components=n_comp, batch_size=max(chunk_size, n_comp))
+                elif is_sparse:
+                    pca = TruncatedSVD(n_components=n_comp)
+                else:
+                    pca = pca_class(n_components=n_comp)
                 X_pca = pca.fit_transform(X)
                 explained_var = np.sum(pca.explained_variance_ratio_)
             
@@ -393,13 +1140,16 @@ class ESGPreprocessingPipeline:
             
             # Use PCA results if available, otherwise use original data
             X_for_tsne = reduction_results['pca'][0] if 'pca' in reduction_results else X
+            if sparse.issparse(X_for_tsne):
+                X_for_tsne = X_for_tsne.toarray()
             
-            tsne = TSNE(
+            X_tsne, tsne = self._fit_tsne(
+                X_for_tsne,
                 n_components=n_components,
                 perplexity=min(perplexity, (len(X) - 1) // 3),  # Adjust perplexity if needed
                 random_state=random_state
             )
-            X_tsne = tsne.fit_transform(X_for_tsne)
+            X_tsne = np.asarray(X_tsne, dtype=np.float32)
             
             tsne_feature_names = [f't-SNE_{i+1}' for i in range(X_tsne.shape[1])]
             reduction_results['tsne'] = (X_tsne, tsne)
@@ -421,6 +1171,13 @@ class ESGPreprocessingPipeline:
         """
         logger.info("Starting preprocessing pipeline fitting and transformation")
         
+        # Short-circuit when this exact data and configuration were processed before
+        cache_file = None
+        if self.config['output'].get('cache_results', False):
+            cache_file = self._cache_dir() / f"{_dataset_fingerprint(df, self.config)}.h5"
+            if cache_file.exists():
+                return self._load_cached_results(cache_file)
+        
         # Step 1: Identify feature types
         feature_types = self._identify_feature_types(df)
         
@@ -431,35 +1188,65 @@ class ESGPreprocessingPipeline:
         numerical_features = feature_types['numerical_features']
         categorical_features = feature_types['categorical_features_available']
         
-        # Extract numerical data
-        X_numerical = df_clean[numerical_features].values
+        # Extract numerical data as column-major float32 for column-wise transformers
+        X_numerical = self._numerical_matrix(df_clean, numerical_features)
         
-        # Step 4: Apply power transformation
-        X_power_transformed, self.power_transformer = self._apply_power_transformation(
-            X_numerical, numerical_features
-        )
+        preprocessing_config = self.config['preprocessing']
+        
+        # Steps 4-5: The numerical and categorical branches share no inputs, so fit them concurrently
+        # when the numba kernels they call are safe to run from two threads
+        df_categorical = df_clean[categorical_features]
+        with ThreadPoolExecutor(max_workers=2 if _kernels_threadsafe() else 1) as executor:
+            power_future = executor.submit(
+                self._cached, 'power_transformation', (X_numerical,), (numerical_features, preprocessing_config),
+                lambda: self._apply_power_transformation(X_numerical, numerical_features)
+            )
+            encoding_future = executor.submit(
+                self._cached, 'categorical_encoding', (df_categorical,), preprocessing_config,
+                lambda: self._encode_categorical_features(df_categorical, categorical_features)
+            )
+            X_power_transformed, self.power_transformer, self._power_cols = power_future.result()
+            X_categorical, categorical_feature_names, self.categorical_encoder = encoding_future.result()
         
         # Use power transformed data if available
         X_to_scale = X_power_transformed if X_power_transformed is not None else X_numerical
         
-        # Step 5: Apply scaling
-        X_scaled, self.scaler = self._apply_scaling(X_to_scale)
-        
-        # Step 6: Encode categorical features
-        X_categorical, categorical_feature_names, self.categorical_encoder = self._encode_categorical_features(
-            df_clean, categorical_features
-        )
-        
-        # Step 7: Combine numerical and categorical features
-        if X_categorical.shape[1] > 0:
-            X_combined = np.hstack([X_scaled, X_categorical])
+        if sparse.issparse(X_categorical):
+            # Step 6-7: Keep the one-hot block sparse and stack scaled features alongside it
+            X_scaled, self.scaler = self._cached(
+                'scaling', (X_to_scale,), preprocessing_config,
+                lambda: self._apply_scaling(X_to_scale)
+            )
+            X_combined = sparse.hstack([sparse.csr_matrix(X_scaled), X_categorical], format='csr')
             combined_feature_names = numerical_features + categorical_feature_names
         else:
-            X_combined = X_scaled
-            combined_feature_names = numerical_features
-        
-        # Step 8: Apply dimensionality reduction
-        reduction_results = self._apply_dimensionality_reduction(X_combined, combined_feature_names)
+            # Step 6: Preallocate the combined matrix and scale numerical features into it
+            n_numerical = len(numerical_features)
+            X_combined = np.empty((len(df_clean), n_numerical + X_categorical.shape[1]),
+                                  dtype=np.float32, order='F')
+            X_scaled, self.scaler = self._cached(
+                'scaling', (X_to_scale,), preprocessing_config,
+                lambda: self._apply_scaling(X_to_scale, out=X_combined[:, :n_numerical])
+            )
+            if not np.shares_memory(X_scaled, X_combined):  # Served from cache
+                X_combined[:, :n_numerical] = X_scaled
+                X_scaled = X_combined[:, :n_numerical]
+            
+            # Step 7: Combine numerical and categorical features
+            if X_categorical.shape[1] > 0:
+                X_combined[:, n_numerical:] = X_categorical
+                combined_feature_names = numerical_features + categorical_feature_names
+            else:
+                combined_feature_names = numerical_features
+        
+        # Step 8: Apply dimensionality reduction (the estimator classes also depend on the
+        # oneDAL backend and on chunked fitting)
+        reduction_results = self._cached(
+            'dimensionality_reduction', (X_combined,),
+            (combined_feature_names, self.config['dimensionality_reduction'], self.use_intelex,
+             preprocessing_config.get('chunk_size')),
+            lambda: self._apply_dimensionality_reduction(X_combined, combined_feature_names)
+        )
         
         # Store results
         results = {}
@@ -472,30 +1259,24 @@ class ESGPreprocessingPipeline:
             results['power_transformed'] = pd.DataFrame(
                 X_power_transformed, 
                 columns=numerical_features, 
-                index=index
+                index=index,
+                copy=False
             )
         
-        # Scaled features
+        # Scaled features (copied so they do not alias the combined matrix)
         results['scaled'] = pd.DataFrame(
             X_scaled, 
             columns=numerical_features, 
-            index=index
+            index=index,
+            copy=True
         )
         
         # Combined features (scaled + encoded categorical)
-        results['combined'] = pd.DataFrame(
-            X_combined, 
-            columns=combined_feature_names, 
-            index=index
-        )
+        results['combined'] = _to_frame(X_combined, combined_feature_names, index)
         
         # Categorical features (if any)
         if X_categorical.shape[1] > 0:
-            results['categorical_encoded'] = pd.DataFrame(
-                X_categorical, 
-                columns=categorical_feature_names, 
-                index=index
-            )
+            results['categorical_encoded'] = _to_frame(X_categorical, categorical_feature_names, index)
         
         # Dimensionality reduction results
         for method, (X_reduced, reducer) in reduction_results.items():
@@ -509,25 +1290,16 @@ class ESGPreprocessingPipeline:
             results[method] = pd.DataFrame(
                 X_reduced, 
                 columns=feature_names, 
-                index=index
+                index=index,
+                copy=False
             )
         
         # Create complete dataset with original + processed features
-        complete_data = df_clean.copy()
-        
-        # Add scaled features
-        for col in results['scaled'].columns:
-            complete_data[f'{col}_scaled'] = results['scaled'][col]
-        
-        # Add PCA features if available
-        if 'pca' in results:
-            for col in results['pca'].columns:
-                complete_data[col] = results['pca'][col]
-        
-        # Add t-SNE features if available
-        if 'tsne' in results:
-            for col in results['tsne'].columns:
-                complete_data[col] = results['tsne'][col]
+        # Original features, scaled features and embeddings concatenated in one call; the scaled
+        # part is derived from the 'scaled' frame so copy-on-write tracks the shared data
+        scaled_part = results['scaled'].add_suffix('_scaled')
+        complete_parts = [df_clean, scaled_part, results.get('pca'), results.get('tsne')]
+        complete_data = pd.concat([part for part in complete_parts if part is not None], axis=1)
         
         results['complete'] = complete_data
         
@@ -538,14 +1310,45 @@ class ESGPreprocessingPipeline:
             'categorical_encoded': categorical_feature_names,
             'combined': combined_feature_names
         }
+        self._feature_counts = {group: len(names) for group, names in self.feature_names_.items()}
+        self._build_transform_plan()
         
         self.fitted = True
+        self._reduce_cache()
         
         self._log_step("Pipeline Fitting Complete", 
                       f"Generated {len(results)} dataset variants")
         
+        if cache_file is not None:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self._save_cached_results(cache_file, results)
+        
         return results
     
+    def _build_transform_plan(self) -> None:
+        """
+        Bind validation-free array callables for the fitted components.
+        
+        transform() runs these on every call instead of the estimators' own
+        transform methods, which re-validate the input each time. Components
+        without a plan entry keep their estimator's transform.
+        """
+        plan = {}
+        
+        power_transformer = self.power_transformer
+        if (isinstance(power_transformer, PowerTransformer) and power_transformer.method == 'yeo-johnson'
+                and not power_transformer.standardize):
+            plan['power'] = partial(_yeo_johnson_inplace, lambdas=power_transformer.lambdas_,
+                                    columns=self._power_cols)
+        
+        if isinstance(self.pca, (PCA, IncrementalPCA)) and not self.pca.whiten:
+            components_t = self.pca.components_.T
+            plan['pca'] = partial(_project, components_t=components_t, offset=self.pca.mean_ @ components_t)
+        elif isinstance(self.pca, TruncatedSVD):
+            plan['pca'] = partial(_project, components_t=self.pca.components_.T, offset=None)
+        
+        self._transform_plan = plan
+    
     def transform(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
         """
         Transform new data using fitted pipeline.
@@ -561,59 +1364,80 @@ class ESGPreprocessingPipeline:
         
         logger.info("Transforming new data using fitted pipeline")
         
-        # Apply same preprocessing steps
-        feature_types = self._identify_feature_types(df)
-        df_clean = self._handle_missing_values(df, feature_types)
+        # Apply same preprocessing steps; the fitted imputers already know their columns
+        df_clean = self._handle_missing_values(df, None, fit=False)
+        plan = self._transform_plan
         
-        # Transform numerical features
+        # Transform numerical features in a work matrix owned by this call
         numerical_features = self.feature_names_['numerical']
-        X_numerical = df_clean[numerical_features].values
+        n_numerical = len(numerical_features)
+        X_numerical = self._numerical_matrix(df_clean, numerical_features)
         
         # Apply power transformation if fitted
         if self.power_transformer is not None:
-            X_numerical = self.power_transformer.transform(X_numerical)
-        
-        # Apply scaling
-        X_scaled = self.scaler.transform(X_numerical)
-        
-        # Transform categorical features
-        if self.categorical_encoder is not None:
-            categorical_features = self.feature_names_['categorical']
+            if 'power' in plan:
+                X_numerical = plan['power'](X_numerical)
+            else:
+                # Transform the skewed columns of the work matrix in place
+                power_columns = self._power_cols
+                X_numerical[:, power_columns] = self._to_host(
+                    self.power_transformer.transform(self._to_device(X_numerical[:, power_columns]))
+                )
+        
+        categorical_features = self.feature_names_['categorical']
+        if self.categorical_encoder is not None and self.categorical_encoder.sparse_output:
+            # Apply scaling and stack alongside the sparse one-hot block
+            X_scaled = self._to_host(self.scaler.transform(self._to_device(X_numerical)))
             X_categorical = self.categorical_encoder.transform(df_clean[categorical_features])
-            X_combined = np.hstack([X_scaled, X_categorical])
+            X_combined = sparse.hstack([sparse.csr_matrix(X_scaled), X_categorical], format='csr')
         else:
-            X_categorical = np.array([]).reshape(len(df_clean), 0)
-            X_combined = X_scaled
+            # Apply scaling and encoding straight into the combined matrix
+            n_categorical = len(self.feature_names_['categorical_encoded'])
+            X_combined = np.empty((len(df_clean), n_numerical + n_categorical), dtype=np.float32, order='F')
+            X_scaled = self._scale_into(X_numerical, X_combined[:, :n_numerical])
+            if self.categorical_encoder is not None:
+                _one_hot_encode(self.categorical_encoder, df_clean[categorical_features],
+                                out=X_combined[:, n_numerical:])
         
         # Apply dimensionality reduction
         results = {}
         index = df_clean.index
         
-        # Scaled features
+        # Scaled features (copied so they do not alias the combined matrix)
         results['scaled'] = pd.DataFrame(
             X_scaled, 
             columns=numerical_features, 
-            index=index
+            index=index,
+            copy=True
         )
         
         # Combined features
-        results['combined'] = pd.DataFrame(
-            X_combined, 
-            columns=self.feature_names_['combined'], 
-            index=index
-        )
+        results['combined'] = _to_frame(X_combined, self.feature_names_['combined'], index)
         
         # PCA
+        X_for_tsne = X_combined
         if self.pca is not None:
-            X_pca = self.pca.transform(X_combined)
+            X_pca = plan['pca'](X_combined) if 'pca' in plan else self.pca.transform(X_combined)
             results['pca'] = pd.DataFrame(
                 X_pca, 
                 columns=[f'PCA_{i+1}' for i in range(X_pca.shape[1])], 
-                index=index
+                index=index,
+                copy=False
+            )
+            X_for_tsne = X_pca
+        
+        # t-SNE: scikit-learn's TSNE cannot embed new points, while openTSNE embeddings
+        # and UMAP place them into the fitted embedding
+        if self.tsne is not None and hasattr(self.tsne, 'transform'):
+            if sparse.issparse(X_for_tsne):
+                X_for_tsne = X_for_tsne.toarray()
+            X_tsne = np.asarray(self.tsne.transform(X_for_tsne), dtype=np.float32)
+            results['tsne'] = pd.DataFrame(
+                X_tsne, 
+                columns=[f't-SNE_{i+1}' for i in range(X_tsne.shape[1])], 
+                index=index,
+                copy=False
             )
-        
-        # t-SNE (Note: t-SNE doesn't have a transform method, would need to refit)
-        # For new data, we typically don't apply t-SNE as it's primarily for visualization
         
         return results
     
@@ -629,12 +1453,15 @@ class ESGPreprocessingPipeline:
         pipeline_data = {
             'config': self.config,
             'feature_names': self.feature_names_,
+            'power_columns': self._power_cols,
             'preprocessing_log': self.preprocessing_log,
             'fitted': self.fitted
         }
         
         # Save scikit-learn objects separately
         components_to_save = {
+            'numerical_imputer': self.numerical_imputer,
+            'categorical_imputer': self.categorical_imputer,
             'power_transformer': self.power_transformer,
             'scaler': self.scaler,
             'categorical_encoder': self.categorical_encoder,
@@ -643,12 +1470,12 @@ class ESGPreprocessingPipeline:
         }
         
         # Save main pipeline data
-        joblib.dump(pipeline_data, f"{filepath}_pipeline.pkl")
+        joblib.dump(pipeline_data, f"{filepath}_pipeline.pkl", compress=_PICKLE_COMPRESSION)
         
         # Save components
         for name, component in components_to_save.items():
             if component is not None:
-                joblib.dump(component, f"{filepath}_{name}.pkl")
+                _save_component(component, f"{filepath}_{name}")
         
         logger.info(f"Pipeline saved to {filepath}")
     
@@ -660,19 +1487,27 @@ class ESGPreprocessingPipeline:
             
             self.config = pipeline_data['config']
             self.feature_names_ = pipeline_data['feature_names']
+            self._feature_counts = {group: len(names) for group, names in self.feature_names_.items()}
             self.preprocessing_log = pipeline_data['preprocessing_log']
             self.fitted = pipeline_data['fitted']
             
             # Load components
-            components_to_load = ['power_transformer', 'scaler', 'categorical_encoder', 'pca', 'tsne']
+            components_to_load = ['numerical_imputer', 'categorical_imputer',
+                                  'power_transformer', 'scaler', 'categorical_encoder', 'pca', 'tsne']
             
             for name in components_to_load:
                 component_path = f"{filepath}_{name}.pkl"
                 if Path(component_path).exists():
-                    setattr(self, name, joblib.load(component_path))
+                    setattr(self, name, _load_component(f"{filepath}_{name}"))
                 else:
                     setattr(self, name, None)
             
+            # Pipelines saved before subset fitting transformed every numerical column
+            self._power_cols = pipeline_data.get('power_columns')
+            if self._power_cols is None and self.power_transformer is not None:
+                self._power_cols = np.arange(len(self.feature_names_['numerical']))
+            
+            self._build_transform_plan()
             logger.info(f"Pipeline loaded from {filepath}")
             
         except Exception as e:
@@ -691,7 +1526,7 @@ class ESGPreprocessingPipeline:
             if dataset_name in ['tsne']:  # Skip visualization datasets
                 continue
                 
-            missing_values = dataset.isnull().sum().sum()
+            missing_values = _count_missing(dataset)
             validation_results[f"{dataset_name}_no_missing"] = missing_values == 0
             
             if missing_values > 0:
@@ -699,15 +1534,15 @@ class ESGPreprocessingPipeline:
         
         # Check feature ranges for scaled data
         if 'scaled' in results and self.config['validation']['check_feature_ranges']:
-            scaled_data = results['scaled']
+            scaled_data = results['scaled'].to_numpy()
             
             # For StandardScaler, mean should be ~0 and std should be ~1
             if isinstance(self.scaler, StandardScaler):
-                means = scaled_data.mean()
-                stds = scaled_data.std()
+                means = np.nanmean(scaled_data, axis=0, dtype=np.float64)
+                stds = np.nanstd(scaled_data, axis=0, ddof=1, dtype=np.float64)
                 
-                mean_check = (abs(means) < 0.1).all()  # Allow small deviations
-                std_check = (abs(stds - 1.0) < 0.1).all()
+                mean_check = bool((np.abs(means) < 0.1).all())  # Allow small deviations
+                std_check = bool((np.abs(stds - 1.0) < 0.1).all())
                 
                 validation_results['scaled_mean_centered'] = mean_check
                 validation_results['scaled_unit_variance'] = std_check
@@ -739,12 +1574,7 @@ class ESGPreprocessingPipeline:
         summary = {
             'pipeline_fitted': self.fitted,
             'config_used': self.config,
-            'feature_counts': {
-                'numerical': len(self.feature_names_.get('numerical', [])),
-                'categorical': len(self.feature_names_.get('categorical', [])),
-                'categorical_encoded': len(self.feature_names_.get('categorical_encoded', [])),
-                'combined': len(self.feature_names_.get('combined', []))
-            },
+            'feature_counts': dict(self._feature_counts),
             'transformations_applied': {
                 'power_transformation': self.power_transformer is not None,
                 'scaling': self.scaler is not None,
@@ -758,6 +1588,87 @@ class ESGPreprocessingPipeline:
         return summary
 
 
+def _save_dataset(dataset: pd.DataFrame, path: Path, save_format: str = 'csv') -> Path:
+    """
+    Save a result dataset as CSV or as zstd-compressed Feather.
+    
+    Feather is written in 64K-row record batches when requested; CSV is used
+    otherwise or when pyarrow is not installed. Returns the path actually written.
+    """
+    if save_format == 'feather' and pyarrow is None:
+        logger.warning("pyarrow is not installed. Saving datasets as CSV.")
+        save_format = 'csv'
+    
+    if save_format == 'feather':
+        if any(isinstance(dtype, pd.SparseDtype) for dtype in dataset.dtypes):
+            dataset = dataset.sparse.to_dense()
+        path = path.with_suffix('.feather')
+        dataset.reset_index(drop=True).to_feather(path, compression='zstd', chunksize=65536)
+    else:
+        path = path.with_suffix('.csv')
+        dataset.to_csv(path, index=False)
+    
+    return path
+
+
+# Sample configuration written by create_config_file
+_SAMPLE_CONFIG = {
+    'preprocessing': {
+        'missing_strategy_numerical': 'median',
+        'missing_strategy_categorical': 'most_frequent',
+        'scaling_method': 'standard',
+        'apply_power_transform': True,
+        'power_transform_method': 'yeo-johnson',
+        'skewness_threshold': 1.0,
+        'categorical_encoding': 'onehot',
+        'drop_first_category': True,
+        'use_gpu': False,
+        'use_intelex': True,
+        'sparse_categorical': False,
+        'chunk_size': None
+    },
+    'dimensionality_reduction': {
+        'apply_pca': True,
+        'pca_n_components': 0.95,
+        'pca_min_components': 5,
+        'pca_random_state': 42,
+        'pca_variance_probe': False,
+        'apply_tsne': True,
+        'tsne_n_components': 2,
+        'tsne_perplexity': 30,
+        'tsne_random_state': 42,
+        'tsne_backend': 'sklearn'
+    },
+    'feature_categories': {
+        'financial_features': ['Revenue', 'ProfitMargin', 'MarketCap', 'GrowthRate'],
+        'esg_features': ['ESG_Overall', 'ESG_Environmental', 'ESG_Social', 'ESG_Governance'],
+        'environmental_features': ['CarbonEmissions', 'WaterUsage', 'EnergyConsumption'],
+        'categorical_features': ['Industry', 'Region'],
+        'identifier_features': ['CompanyID', 'CompanyName', 'Year']
+    },
+    'validation': {
+        'check_missing_values': True,
+        'check_feature_ranges': True,
+        'check_shape_consistency': True,
+        'log_transformations': True
+    },
+    'output': {
+        'save_intermediate_steps': True,
+        'save_path': '../Data/',
+        'save_fitted_pipeline': True,
+        'pipeline_save_path': '../Models/',
+        'cache_intermediate_steps': False,
+        'cache_max_size_mb': 512,
+        'cache_results': False,
+        'save_format': 'csv'
+    }
+}
+
+# Serialised once at import; create_config_file only writes these strings
+_SAMPLE_CONFIG_YAML = yaml.dump(_SAMPLE_CONFIG, Dumper=_YAML_DUMPER, default_flow_style=False, indent=2)
+_SAMPLE_CONFIG_JSON = json.dumps(_SAMPLE_CONFIG, indent=2)
+
+
 def create_config_file(filepath: str, config_type: str = 'yaml') -> None:
     """
     Create a sample configuration file for the preprocessing pipeline.
@@ -766,56 +1677,15 @@ def create_config_file(filepath: str, config_type: str = 'yaml') -> None:
         filepath: Path where to save the configuration file
         config_type: Type of config file ('yaml' or 'json')
     """
-    sample_config = {
-        'preprocessing': {
-            'missing_strategy_numerical': 'median',
-            'missing_strategy_categorical': 'most_frequent',
-            'scaling_method': 'standard',
-            'apply_power_transform': True,
-            'power_transform_method': 'yeo-johnson',
-            'skewness_threshold': 1.0,
-            'categorical_encoding': 'onehot',
-            'drop_first_category': True
-        },
-        'dimensionality_reduction': {
-            'apply_pca': True,
-            'pca_n_components': 0.95,
-            'pca_min_components': 5,
-            'apply_tsne': True,
-            'tsne_n_components': 2,
-            'tsne_perplexity': 30,
-            'tsne_random_state': 42
-        },
-        'feature_categories': {
-            'financial_features': ['Revenue', 'ProfitMargin', 'MarketCap', 'GrowthRate'],
-            'esg_features': ['ESG_Overall', 'ESG_Environmental', 'ESG_Social', 'ESG_Governance'],
-            'environmental_features': ['CarbonEmissions', 'WaterUsage', 'EnergyConsumption'],
-            'categorical_features': ['Industry', 'Region'],
-            'identifier_features': ['CompanyID', 'CompanyName', 'Year']
-        },
-        'validation': {
-            'check_missing_values': True,
-            'check_feature_ranges': True,
-            'check_shape_consistency': True,
-            'log_transformations': True
-        },
-        'output': {
-            'save_intermediate_steps': True,
-            'save_path': '../Data/',
-            'save_fitted_pipeline': True,
-            'pipeline_save_path': '../Models/'
-        }
-    }
-    
     # Ensure directory exists
     Path(filepath).parent.mkdir(parents=True, exist_ok=True)
     
     if config_type.lower() == 'yaml':
         with open(filepath, 'w') as f:
-            yaml.dump(sample_config, f, default_flow_style=False, indent=2)
+            f.write(_SAMPLE_CONFIG_YAML)
     else:
         with open(filepath, 'w') as f:
-            json.dump(sample_config, f, indent=2)
+            f.write(_SAMPLE_CONFIG_JSON)
     
     print(f"Sample configuration saved to {filepath}")
 
@@ -830,7 +1700,11 @@ def run_pipeline_example(data_path: str, config_path: Optional[str] = None) -> N
     """
     # Load data
     print(f"Loading data from {data_path}")
-    data = pd.read_csv(data_path)
+    if pyarrow is not None:
+        # Multithreaded parsing into Arrow-backed columns
+        data = pd.read_csv(data_path, engine='pyarrow', dtype_backend='pyarrow')
+    else:
+        data = pd.read_csv(data_path)
     print(f"Data shape: {data.shape}")
     
     # Initialize pipeline
@@ -864,15 +1738,23 @@ def run_pipeline_example(data_path: str, config_path: Optional[str] = None) -> N
     data_dir = Path('../Data')
     data_dir.mkdir(exist_ok=True)
     
-    for dataset_name, dataset in results.items():
-        if dataset_name != 'complete':  # Save main datasets separately
-            output_path = data_dir / f"{dataset_name}_features.csv"
-            dataset.to_csv(output_path, index=False)
-            print(f"Saved {dataset_name} features to {output_path}")
-    
-    # Save complete dataset
-    results['complete'].to_csv(data_dir / 'preprocessed_complete_dataset.csv', index=False)
-    print(f"Saved complete dataset to {data_dir / 'preprocessed_complete_dataset.csv'}")
+    save_format = pipeline.config['output'].get('save_format', 'csv')
+    
+    # Write all datasets concurrently; serialization and compression release the GIL
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        writes = {
+            dataset_name: executor.submit(_save_dataset, dataset, data_dir / f"{dataset_name}_features", save_format)
+            for dataset_name, dataset in results.items()
+            if dataset_name != 'complete'  # Save main datasets separately
+        }
+        
+        # Save complete dataset
+        complete_write = executor.submit(_save_dataset, results['complete'],
+                                         data_dir / 'preprocessed_complete_dataset', save_format)
+        
+        for dataset_name, write in writes.items():
+            print(f"Saved {dataset_name} features to {write.result()}")
+        print(f"Saved complete dataset to {complete_write.result()}")
 
 
 if __name__ == "__main__":
@@ -67,12 +67,12 @@ print(f'Generated at: {pd.Timestamp.now()}')
 
 # Check output files
 output_dir = Path('$OUTPUT_DIR')
-files_created = list(output_dir.glob('*.csv'))
+files_created = list(output_dir.glob('*.csv')) + list(output_dir.glob('*.feather'))
 
 print(f'\\nOutput files created: {len(files_created)}')
 for file in sorted(files_created):
     if file.exists():
-        df = pd.read_csv(file)
+        df = pd.read_feather(file) if file.suffix == '.feather' else pd.read_csv(file)
         print(f'  ✓ {file.name}: {df.shape}')
     else:
         print(f'  ✗ {file.name}: Not found')
@@ -9,23 +9,28 @@ import pytest
 import pandas as pd
 import numpy as np
 import tempfile
+import json
 import shutil
 from pathlib import Path
 import sys
 import os
+import subprocess
+import textwrap
 
 # Add the preprocessing module to the path
 sys.path.append(os.path.dirname(__file__))
 
-from preprocessing_pipeline import ESGPreprocessingPipeline, create_config_file
+from preprocessing_pipeline import (
+    ESGPreprocessingPipeline, create_config_file, _column_skew, _one_hot_encode, _save_dataset
+)
 
 
 class TestESGPreprocessingPipeline:
     """Test suite for ESG Preprocessing Pipeline."""
     
-    @pytest.fixture
-    def sample_data(self):
-        """Create sample ESG data for testing."""
+    @pytest.fixture(scope='session')
+    def session_sample_data(self):
+        """Create sample ESG data once per test session."""
         np.random.seed(42)
         n_samples = 1000
         
@@ -58,6 +63,11 @@ class TestESGPreprocessingPipeline:
         return df
     
     @pytest.fixture
+    def sample_data(self, session_sample_data):
+        """Give each test its own view of the session data; copy-on-write keeps changes from leaking."""
+        return session_sample_data.copy(deep=False)
+    
+    @pytest.fixture(scope='session')
     def temp_config(self):
         """Create temporary configuration file."""
         temp_dir = tempfile.mkdtemp()
@@ -80,6 +90,9 @@ class TestESGPreprocessingPipeline:
         pipeline_default = ESGPreprocessingPipeline()
         assert pipeline_default.config is not None
         assert not pipeline_default.fitted
+        
+        # Datasets stay CSV by default for the notebooks that read them
+        assert pipeline_default.config['output']['save_format'] == 'csv'
     
     def test_feature_type_identification(self, sample_data):
         """Test automatic feature type identification."""
@@ -95,6 +108,15 @@ class TestESGPreprocessingPipeline:
         assert 'Revenue' in feature_types['numerical_features']
         assert 'Industry' in feature_types['categorical_features_available']
     
+    def test_feature_type_identification_arrow_backed(self, sample_data):
+        """Test that Arrow-backed columns (read_csv dtype_backend='pyarrow') are identified."""
+        pytest.importorskip('pyarrow')
+        pipeline = ESGPreprocessingPipeline()
+        
+        arrow_data = sample_data.convert_dtypes(dtype_backend='pyarrow')
+        
+        assert pipeline._identify_feature_types(arrow_data) == pipeline._identify_feature_types(sample_data)
+    
     def test_missing_value_handling(self, sample_data):
         """Test missing value imputation."""
         pipeline = ESGPreprocessingPipeline()
@@ -108,6 +130,25 @@ class TestESGPreprocessingPipeline:
         
         # Verify no missing values remain
         assert df_clean.isnull().sum().sum() == 0
+        
+        # Verify the input dataframe was left untouched
+        assert sample_data.isnull().sum().sum() > 0
+    
+    def test_missing_value_handling_reuses_fitted_statistics(self, sample_data):
+        """Test that new data is imputed with statistics learned during fitting."""
+        pipeline = ESGPreprocessingPipeline()
+        train_data = sample_data.iloc[:800]
+        feature_types = pipeline._identify_feature_types(train_data)
+        pipeline._handle_missing_values(train_data, feature_types)
+        
+        # Impute new data that has different statistics
+        test_data = sample_data.iloc[800:]
+        test_data['Revenue'] = test_data['Revenue'] * 100
+        test_data.loc[test_data.index[:10], 'Revenue'] = np.nan
+        df_clean = pipeline._handle_missing_values(test_data, feature_types, fit=False)
+        
+        train_median = train_data['Revenue'].median()
+        assert np.allclose(df_clean.loc[test_data.index[:10], 'Revenue'], train_median)
     
     def test_power_transformation(self, sample_data):
         """Test power transformation for skewness reduction."""
@@ -118,7 +159,7 @@ class TestESGPreprocessingPipeline:
         X = sample_data[numerical_features].dropna().values
         
         # Apply power transformation
-        X_transformed, transformer = pipeline._apply_power_transformation(X, numerical_features)
+        X_transformed, transformer, power_columns = pipeline._apply_power_transformation(X, numerical_features)
         
         if transformer is not None:
             # Check that transformation was applied
@@ -134,6 +175,85 @@ class TestESGPreprocessingPipeline:
                 if original_skew >= 1.0:  # Only check highly skewed features
                     assert transformed_skew <= original_skew  # Should be reduced or same
     
+    def test_power_transformation_log1p_replay(self, sample_data):
+        """Test that log1p-shortcut columns are replayed exactly by the fitted transformer."""
+        pipeline = ESGPreprocessingPipeline()
+        
+        numerical_features = ['Revenue', 'ProfitMargin', 'MarketCap']
+        X = sample_data[numerical_features].dropna().values
+        
+        X_transformed, transformer, power_columns = pipeline._apply_power_transformation(X, numerical_features)
+        
+        # Positive, highly skewed Revenue goes through log1p (lambda = 0)
+        assert transformer.lambdas_[0] == 0
+        assert np.allclose(X_transformed[:, 0], np.log1p(X[:, 0]))
+        assert np.allclose(transformer.transform(X[:, power_columns]), X_transformed[:, power_columns])
+        
+        # Roughly symmetric ProfitMargin is not fitted and passes through unchanged
+        assert list(power_columns) == [0, 2]
+        np.testing.assert_array_equal(X_transformed[:, 1], X[:, 1])
+    
+    def test_power_transformation_left_skewed_non_negative(self):
+        """Test that non-negative left-skewed columns get a fitted lambda instead of log1p."""
+        from scipy.stats import skew
+        from sklearn.preprocessing import PowerTransformer
+        
+        rng = np.random.default_rng(0)
+        X = (100 - rng.lognormal(2, 0.8, size=(1000, 1))).clip(min=0)
+        assert X.min() >= 0 and skew(X[:, 0]) < -1
+        
+        pipeline = ESGPreprocessingPipeline()
+        X_transformed, transformer, power_columns = pipeline._apply_power_transformation(X, ['Score'])
+        
+        reference = PowerTransformer(standardize=False).fit(X)
+        assert transformer.lambdas_[0] != 0
+        assert np.isclose(transformer.lambdas_[0], reference.lambdas_[0], rtol=1e-3)
+        assert abs(skew(X_transformed[:, 0])) < abs(skew(X[:, 0]))
+    
+    def test_column_skew_matches_scipy(self, sample_data):
+        """Test that the fused skewness kernel agrees with scipy."""
+        from scipy.stats import skew
+        
+        numerical_features = ['Revenue', 'ProfitMargin', 'MarketCap', 'CarbonEmissions']
+        X = sample_data[numerical_features].dropna().values
+        
+        assert np.allclose(_column_skew(X), skew(X, axis=0))
+    
+    @pytest.mark.parametrize('use_numba', [True, False])
+    def test_one_hot_encode_matches_encoder(self, sample_data, monkeypatch, use_numba):
+        """Test that the one-hot scatter agrees with OneHotEncoder, including unknown categories."""
+        from sklearn.preprocessing import OneHotEncoder
+        import preprocessing_pipeline
+        
+        if not use_numba:
+            monkeypatch.setattr(preprocessing_pipeline, '_one_hot_kernel_jit', None)
+        
+        df_cat = sample_data[['Industry', 'Region']].fillna('Unknown')
+        df_new = df_cat.copy()
+        df_new.iloc[:5, 0] = 'UnseenIndustry'
+        
+        for drop in (None, 'first'):
+            encoder = OneHotEncoder(drop=drop, sparse_output=False, handle_unknown='ignore',
+                                    dtype=np.float32).fit(df_cat)
+            np.testing.assert_array_equal(_one_hot_encode(encoder, df_new), encoder.transform(df_new))
+    
+    def test_categorical_vocabulary_matches_auto(self, sample_data):
+        """Test that the precomputed encoder vocabulary matches OneHotEncoder's own discovery."""
+        from sklearn.preprocessing import OneHotEncoder
+        
+        df_cat = sample_data[['Industry', 'Region']].fillna('Unknown')
+        df_cat['Region'] = pd.Categorical(df_cat['Region'],
+                                          categories=sorted(df_cat['Region'].unique())[::-1] + ['Unused'])
+        
+        pipeline = ESGPreprocessingPipeline()
+        X, feature_names, encoder = pipeline._encode_categorical_features(df_cat, ['Industry', 'Region'])
+        expected = OneHotEncoder(drop='first', sparse_output=False, dtype=np.float32).fit(df_cat.astype(object))
+        
+        for categories, expected_categories in zip(encoder.categories_, expected.categories_):
+            np.testing.assert_array_equal(categories, expected_categories)
+        np.testing.assert_array_equal(X, expected.transform(df_cat.astype(object)))
+        assert feature_names == list(expected.get_feature_names_out())
+    
     def test_scaling(self, sample_data):
         """Test feature scaling."""
         pipeline = ESGPreprocessingPipeline()
@@ -187,14 +307,161 @@ class TestESGPreprocessingPipeline:
         for dataset_name, dataset in results.items():
             assert len(dataset) == n_samples
             assert isinstance(dataset, pd.DataFrame)
+        
+        # Check that numerical outputs stay in float32 end to end
+        for dataset_name in ['power_transformed', 'scaled', 'combined', 'pca', 'tsne']:
+            if dataset_name in results:
+                assert (results[dataset_name].dtypes == np.float32).all()
+    
+    def test_fit_transform_results_do_not_alias(self, sample_data):
+        """Test that writing to one result frame leaves the others unchanged."""
+        pipeline = ESGPreprocessingPipeline()
+        pipeline.config['dimensionality_reduction']['apply_tsne'] = False
+        results = pipeline.fit_transform(sample_data)
+        
+        expected_complete = results['complete']['Revenue_scaled'].copy()
+        expected_scaled = results['scaled']['Revenue'].copy()
+        results['combined'].iloc[0, results['combined'].columns.get_loc('Revenue')] = 999
+        
+        pd.testing.assert_series_equal(results['complete']['Revenue_scaled'], expected_complete)
+        pd.testing.assert_series_equal(results['scaled']['Revenue'], expected_scaled)
+    
+    def test_pca_variance_probe_matches_full_fit(self):
+        """Test that the randomized PCA probe picks the same components as a full fit."""
+        from sklearn.decomposition import PCA
+        
+        rng = np.random.default_rng(0)
+        latent = rng.normal(size=(300, 8))
+        X = (latent @ rng.normal(size=(8, 120)) + 0.05 * rng.normal(size=(300, 120))).astype(np.float32)
+        
+        pipeline = ESGPreprocessingPipeline()
+        pipeline.config['dimensionality_reduction']['apply_tsne'] = False
+        pipeline.config['dimensionality_reduction']['pca_variance_probe'] = True
+        X_pca, pca = pipeline._apply_dimensionality_reduction(X, [])['pca']
+        
+        full = PCA(n_components=0.95).fit(X)
+        n_expected = max(full.n_components_, pipeline.config['dimensionality_reduction']['pca_min_components'])
+        assert X_pca.shape == (300, n_expected)
+        assert np.allclose(pca.explained_variance_ratio_[:full.n_components_],
+                           full.explained_variance_ratio_, atol=1e-3)
+        assert pca.svd_solver == 'randomized'
+        
+        # The probe is opt-in, so the default configuration fits the full spectrum
+        pipeline.config['dimensionality_reduction']['pca_variance_probe'] = False
+        assert pipeline._apply_dimensionality_reduction(X, [])['pca'][1].svd_solver != 'randomized'
+    
+    def test_chunked_fit_matches_full_batch(self, sample_data):
+        """Test that streaming scaler/PCA fits over row batches match the full-batch fit."""
+        data = sample_data.drop(columns=['CompanyName']).iloc[:600]
+        
+        results = {}
+        for chunk_size in (None, 128):
+            pipeline = ESGPreprocessingPipeline()
+            pipeline.config['preprocessing']['chunk_size'] = chunk_size
+            pipeline.config['dimensionality_reduction']['apply_tsne'] = False
+            results[chunk_size] = (pipeline.fit_transform(data), pipeline)
+        
+        (full, _), (chunked, pipeline) = results[None], results[128]
+        assert pipeline.pca.__class__.__name__ == 'IncrementalPCA'
+        assert np.allclose(chunked['scaled'], full['scaled'], atol=1e-4)
+        assert chunked['pca'].shape == full['pca'].shape
+        # Components are only defined up to sign
+        assert np.allclose(np.abs(chunked['pca']), np.abs(full['pca']), atol=1e-2)
+    
+    def test_concurrent_branches_under_workqueue_layer(self):
+        """Test that numba kernels never run concurrently under the non-threadsafe workqueue layer."""
+        pytest.importorskip('numba')
+        
+        # The threading layer is fixed per process, so run the fit in a fresh interpreter
+        script = textwrap.dedent("""
+            import threading, time
+            import numpy as np, pandas as pd
+            import preprocessing_pipeline as pp
+            
+            lock, active, overlaps = threading.Lock(), [0], []
+            
+            def exclusive(kernel):
+                def run(*args):
+                    with lock:
+                        active[0] += 1
+                        overlaps.append(active[0] > 1)
+                    time.sleep(0.2)  # Widen the window in which a concurrent call would overlap
+                    try:
+                        return kernel(*args)
+                    finally:
+                        with lock:
+                            active[0] -= 1
+                return run
+            
+            pp._column_skew = exclusive(pp._column_skew)
+            pp._one_hot_scatter = exclusive(pp._one_hot_scatter)
+            
+            rng = np.random.default_rng(0)
+            data = pd.DataFrame(rng.lognormal(size=(20000, 8)), columns=[f'x{i}' for i in range(8)])
+            data['Industry'] = rng.choice(['Technology', 'Finance', 'Energy'], len(data))
+            pipeline = pp.ESGPreprocessingPipeline()
+            pipeline.config['dimensionality_reduction']['apply_tsne'] = False
+            pipeline.fit_transform(data)
+            
+            assert pp.numba.threading_layer() == 'workqueue'
+            assert overlaps and not any(overlaps), overlaps
+        """)
+        env = dict(os.environ, NUMBA_THREADING_LAYER='workqueue', NUMBA_NUM_THREADS='4')
+        completed = subprocess.run([sys.executable, '-c', script], cwd=os.path.dirname(__file__) or '.',
+                                   env=env, capture_output=True, text=True, timeout=600)
+        assert completed.returncode == 0, completed.stderr[-2000:]
+    
+    def test_sparse_categorical_encoding(self, sample_data):
+        """Test that sparse one-hot output flows through TruncatedSVD."""
+        pipeline = ESGPreprocessingPipeline()
+        pipeline.config['preprocessing']['sparse_categorical'] = True
+        pipeline.config['dimensionality_reduction']['apply_tsne'] = False
+        
+        data = sample_data.drop(columns=['CompanyName'])
+        results = pipeline.fit_transform(data.iloc[:800])
+        
+        assert isinstance(results['combined'].dtypes.iloc[-1], pd.SparseDtype)
+        assert pipeline.pca.__class__.__name__ == 'TruncatedSVD'
+        assert len(results['pca']) == 800
+        
+        # Transform new data with the sparse pipeline
+        test_results = pipeline.transform(data.iloc[800:])
+        assert test_results['pca'].shape == (200, results['pca'].shape[1])
+    
+    def test_opentsne_backend(self, sample_data):
+        """Test the multicore openTSNE backend for the t-SNE embedding."""
+        pytest.importorskip('openTSNE')
+        
+        pipeline = ESGPreprocessingPipeline()
+        pipeline.config['dimensionality_reduction']['tsne_backend'] = 'openTSNE'
+        
+        results = pipeline.fit_transform(sample_data)
+        
+        assert results['tsne'].shape == (len(sample_data), 2)
+        assert np.isfinite(results['tsne'].values).all()
+        
+        # New points are embedded into the fitted openTSNE embedding
+        transformed = pipeline.transform(sample_data.head(20))
+        assert transformed['tsne'].shape == (20, 2)
+        assert np.isfinite(transformed['tsne'].values).all()
+    
+    def test_tsne_ignores_intelex_backend(self, sample_data):
+        """Test that t-SNE stays on scikit-learn when the oneDAL PCA backend is enabled."""
+        from sklearn.manifold import TSNE
+        
+        pipeline = ESGPreprocessingPipeline()
+        pipeline.config['preprocessing']['use_intelex'] = True
+        pipeline.fit_transform(sample_data.iloc[:200])
+        
+        assert type(pipeline.tsne) is TSNE
     
     def test_transform_new_data(self, sample_data):
         """Test transforming new data with fitted pipeline."""
         pipeline = ESGPreprocessingPipeline()
         
         # Split data
-        train_data = sample_data.iloc[:800].copy()
-        test_data = sample_data.iloc[800:].copy()
+        train_data = sample_data.iloc[:800]
+        test_data = sample_data.iloc[800:]
         
         # Fit on training data
         pipeline.fit_transform(train_data)
@@ -206,6 +473,55 @@ class TestESGPreprocessingPipeline:
         assert 'scaled' in test_results
         assert len(test_results['scaled']) == len(test_data)
     
+    def test_transform_plan_matches_estimators(self, sample_data):
+        """Test that the validation-free transform plan reproduces the estimators' transforms."""
+        pipeline = ESGPreprocessingPipeline()
+        pipeline.config['dimensionality_reduction']['apply_tsne'] = False
+        pipeline.fit_transform(sample_data.iloc[:800])
+        assert set(pipeline._transform_plan) == {'power', 'pca'}
+        
+        test_data = sample_data.iloc[800:]
+        planned = pipeline.transform(test_data)
+        pipeline._transform_plan = {}
+        reference = pipeline.transform(test_data)
+        
+        for name in ('scaled', 'combined', 'pca'):
+            np.testing.assert_allclose(planned[name], reference[name], rtol=1e-5, atol=1e-5)
+    
+    def test_transform_log_keeps_fit_record(self, sample_data, monkeypatch):
+        """Test that per-batch transform() log entries do not evict the fit-time log."""
+        import preprocessing_pipeline
+        
+        monkeypatch.setattr(preprocessing_pipeline, '_LOG_MAX_ENTRIES', 4)
+        pipeline = ESGPreprocessingPipeline()
+        pipeline.config['dimensionality_reduction']['apply_tsne'] = False
+        pipeline.fit_transform(sample_data.iloc[:800])
+        fit_log = pipeline.preprocessing_log
+        
+        for _ in range(10):
+            pipeline.transform(sample_data.iloc[800:])
+        
+        log = pipeline.preprocessing_log
+        assert log[:len(fit_log)] == fit_log
+        assert len(log) == len(fit_log) + 4
+        assert [entry['timestamp'] for entry in log] == sorted(entry['timestamp'] for entry in log)
+    
+    def test_transform_concurrent_batches(self, sample_data):
+        """Test that concurrent transform() calls on different batches do not share state."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        pipeline = ESGPreprocessingPipeline()
+        pipeline.config['dimensionality_reduction']['apply_tsne'] = False
+        pipeline.fit_transform(sample_data.iloc[:800])
+        
+        batches = [sample_data.iloc[800:900], sample_data.iloc[900:1000]]
+        expected = [pipeline.transform(batch)['scaled'] for batch in batches]
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(pipeline.transform, batches[i % 2]) for i in range(40)]
+            for i, future in enumerate(futures):
+                pd.testing.assert_frame_equal(future.result()['scaled'], expected[i % 2])
+    
     def test_pipeline_persistence(self, sample_data, temp_config):
         """Test saving and loading pipeline."""
         pipeline1 = ESGPreprocessingPipeline(temp_config)
@@ -226,13 +542,150 @@ class TestESGPreprocessingPipeline:
         assert pipeline2.fitted
         
         # Transform new data with loaded pipeline
-        test_data = sample_data.iloc[:100].copy()
+        test_data = sample_data.iloc[:100]
         results2 = pipeline2.transform(test_data)
         
         # Check that results have correct structure
         assert 'scaled' in results2
         assert len(results2['scaled']) == len(test_data)
         
+        # Check that loaded components reproduce the original transform
+        pd.testing.assert_frame_equal(results2['pca'], pipeline1.transform(test_data)['pca'])
+        assert isinstance(pipeline2.pca.components_, np.memmap)
+        
+        # Cleanup
+        shutil.rmtree(temp_dir)
+    
+    def test_intermediate_step_cache(self, sample_data, monkeypatch):
+        """Test that repeated fits reuse cached intermediate steps until the cache version changes."""
+        import preprocessing_pipeline
+        
+        temp_dir = tempfile.mkdtemp()
+        config_path = Path(temp_dir) / 'cache_config.json'
+        config_path.write_text(json.dumps({
+            'dimensionality_reduction': {'apply_tsne': False},
+            'output': {'save_path': temp_dir, 'cache_intermediate_steps': True}
+        }))
+        
+        results1 = ESGPreprocessingPipeline(str(config_path)).fit_transform(sample_data)
+        
+        pipeline2 = ESGPreprocessingPipeline(str(config_path))
+        results2 = pipeline2.fit_transform(sample_data)
+        
+        # Check that every step was served from the cache
+        cache_hits = [entry for entry in pipeline2.preprocessing_log if entry['step'] == 'Cache Hit']
+        assert len(cache_hits) == 4
+        
+        for dataset_name in results1:
+            pd.testing.assert_frame_equal(results1[dataset_name], results2[dataset_name])
+        
+        # A new cache version must not reuse entries written by the old implementation
+        monkeypatch.setattr(preprocessing_pipeline, '_CACHE_VERSION', preprocessing_pipeline._CACHE_VERSION + 1)
+        pipeline3 = ESGPreprocessingPipeline(str(config_path))
+        pipeline3.fit_transform(sample_data)
+        assert not [entry for entry in pipeline3.preprocessing_log if entry['step'] == 'Cache Hit']
+        
+        # Cleanup
+        shutil.rmtree(temp_dir)
+    
+    def test_intermediate_step_cache_reduction_backend(self, sample_data):
+        """Test that cached dimensionality reduction is not reused across PCA backends."""
+        temp_dir = tempfile.mkdtemp()
+        data = sample_data.drop(columns=['CompanyName']).iloc[:600]
+        
+        def fit(**preprocessing):
+            config_path = Path(temp_dir) / 'cache_config.json'
+            config_path.write_text(json.dumps({
+                'preprocessing': preprocessing,
+                'dimensionality_reduction': {'apply_tsne': False},
+                'output': {'save_path': temp_dir, 'cache_intermediate_steps': True}
+            }))
+            pipeline = ESGPreprocessingPipeline(str(config_path))
+            pipeline.fit_transform(data)
+            return pipeline
+        
+        fit(use_intelex=True)
+        assert fit(use_intelex=False).pca.__class__.__module__.startswith('sklearn.')
+        assert fit(chunk_size=128).pca.__class__.__name__ == 'IncrementalPCA'
+        
+        # Cleanup
+        shutil.rmtree(temp_dir)
+    
+    def test_result_cache(self, sample_data, monkeypatch):
+        """Test that an identical fit is served from the cached results."""
+        import preprocessing_pipeline
+        
+        pytest.importorskip('tables')
+        temp_dir = tempfile.mkdtemp()
+        config_path = Path(temp_dir) / 'result_cache_config.json'
+        config_path.write_text(json.dumps({
+            'dimensionality_reduction': {'apply_tsne': False},
+            'output': {'save_path': temp_dir, 'cache_results': True}
+        }))
+        
+        results1 = ESGPreprocessingPipeline(str(config_path)).fit_transform(sample_data)
+        
+        pipeline2 = ESGPreprocessingPipeline(str(config_path))
+        results2 = pipeline2.fit_transform(sample_data)
+        
+        assert pipeline2.fitted
+        assert pipeline2.preprocessing_log[-1]['step'] == 'Cache Hit'
+        assert list(results2) == list(results1)
+        for dataset_name in results1:
+            pd.testing.assert_frame_equal(results1[dataset_name], results2[dataset_name])
+        
+        # New data must still be transformable with the restored components
+        transformed = pipeline2.transform(sample_data.head(10))
+        assert 'pca' in transformed
+        
+        # Results written by an older cache version are recomputed
+        monkeypatch.setattr(preprocessing_pipeline, '_CACHE_VERSION', preprocessing_pipeline._CACHE_VERSION + 1)
+        pipeline3 = ESGPreprocessingPipeline(str(config_path))
+        pipeline3.fit_transform(sample_data)
+        assert not [entry for entry in pipeline3.preprocessing_log if entry['step'] == 'Cache Hit']
+        
+        # Cleanup
+        shutil.rmtree(temp_dir)
+    
+    def test_result_cache_categorical_input(self, sample_data):
+        """Test that results with category columns skip the HDF5 cache without leaving files behind."""
+        pytest.importorskip('tables')
+        temp_dir = tempfile.mkdtemp()
+        config_path = Path(temp_dir) / 'result_cache_config.json'
+        config_path.write_text(json.dumps({
+            'dimensionality_reduction': {'apply_tsne': False},
+            'output': {'save_path': temp_dir, 'cache_results': True}
+        }))
+        
+        data = sample_data.astype({'Industry': 'category', 'Region': 'category'})
+        results = ESGPreprocessingPipeline(str(config_path)).fit_transform(data)
+        
+        assert isinstance(results['complete']['Industry'].dtype, pd.CategoricalDtype)
+        assert not list((Path(temp_dir) / '.cache').glob('*'))
+        
+        # Cleanup
+        shutil.rmtree(temp_dir)
+    
+    def test_save_dataset_formats(self, sample_data):
+        """Test saving result datasets as Feather and CSV."""
+        pytest.importorskip('pyarrow')
+        temp_dir = tempfile.mkdtemp()
+        dataset = sample_data[['Revenue', 'Industry']].iloc[10:50]
+        
+        feather_path = _save_dataset(dataset, Path(temp_dir) / 'features', 'feather')
+        assert feather_path.suffix == '.feather'
+        
+        # Missing strings come back as None rather than NaN, so compare them through a common marker
+        restored = pd.read_feather(feather_path)
+        expected = dataset.reset_index(drop=True)
+        pd.testing.assert_series_equal(restored['Industry'].isna(), expected['Industry'].isna())
+        pd.testing.assert_frame_equal(restored.fillna({'Industry': 'missing'}),
+                                      expected.fillna({'Industry': 'missing'}))
+        
+        csv_path = _save_dataset(dataset, Path(temp_dir) / 'features', 'csv')
+        assert csv_path.suffix == '.csv'
+        assert pd.read_csv(csv_path).shape == dataset.shape
+        
         # Cleanup
         shutil.rmtree(temp_dir)
     
@@ -271,6 +724,9 @@ class TestESGPreprocessingPipeline:
         assert 'pipeline_fitted' in summary_after
         assert summary_after['pipeline_fitted'] is True
         assert 'feature_counts' in summary_after
+        assert summary_after['feature_counts'] == {
+            group: len(names) for group, names in pipeline.feature_names_.items()
+        }
         assert 'transformations_applied' in summary_after
         assert 'preprocessing_log' in summary_after
     